@@ -22,12 +22,36 @@ Usage:
     plaintext = decryptor.decrypt_message(nonce, ciphertext)
 """
 
-from .decryptor import MessageDecryptor
-from .encryptor import MessageEncryptor
-from .key_manager import KeyManager
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .decryptor import MessageDecryptor
+    from .encryptor import MessageEncryptor
+    from .key_manager import KeyManager
+
+# Submodules are imported on first attribute access (PEP 562), so the
+# cryptography bindings are only loaded once encryption is actually used.
+_LAZY = {
+    "MessageEncryptor": ".encryptor",
+    "MessageDecryptor": ".decryptor",
+    "KeyManager": ".key_manager",
+}
 
 __all__ = [
     "MessageEncryptor",
     "MessageDecryptor",
     "KeyManager",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY:
+        value = getattr(importlib.import_module(_LAZY[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -1,5 +1,6 @@
 """
-Decryption module for platform messages using AES-256-GCM.
+Decryption module for platform messages using AES-256-GCM (default) or
+ChaCha20-Poly1305.
 
 Handles decryption of encrypted messages with authentication tag verification
 to ensure data integrity and authenticity.
@@ -7,13 +8,17 @@ to ensure data integrity and authenticity.
 
 from __future__ import annotations
 
+import binascii
+from collections.abc import Sequence
+
 from cryptography.exceptions import InvalidTag
-from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+
+from .encryptor import _AEAD_CLASSES, AeadAlgorithm
 
 
 class MessageDecryptor:
     """
-    Handles decryption of platform messages using AES-256-GCM.
+    Handles decryption of platform messages using AES-256-GCM (or ChaCha20-Poly1305).
 
     Decryption process automatically verifies the authentication tag,
     ensuring the message has not been tampered with or corrupted.
@@ -21,28 +26,37 @@ class MessageDecryptor:
     Security properties:
     - Authentication tag verification is automatic
     - Decryption fails if tag is invalid or ciphertext modified
-    - Must use same key and nonce as encryption
+    - Must use same key, nonce and algorithm as encryption
     """
 
-    def __init__(self, key: bytes) -> None:
+    def __init__(self, key: bytes, algorithm: AeadAlgorithm = "aes-256-gcm") -> None:
         """
         Initialize decryptor with decryption key.
 
         Args:
             key: 32-byte (256-bit) decryption key (same as encryption key)
+            algorithm: AEAD cipher used by the encryptor: "aes-256-gcm" (default)
+                       or "chacha20-poly1305"
 
         Raises:
-            ValueError: If key is not 32 bytes
+            ValueError: If key is not 32 bytes or algorithm is not supported
         """
         if len(key) != 32:
             raise ValueError(f"Key must be 32 bytes (256 bits), got {len(key)} bytes")
 
+        if algorithm not in _AEAD_CLASSES:
+            raise ValueError(f"Unsupported AEAD algorithm: {algorithm!r}")
+
         self.key = key
-        self.aesgcm = AESGCM(key)
+        self.algorithm = algorithm
+        # Kept under its historical name; holds whichever AEAD is configured.
+        self.aesgcm = _AEAD_CLASSES[algorithm](key)
+        # Bound once; decrypt paths skip the attribute lookups per message.
+        self._decrypt = self.aesgcm.decrypt
 
     def decrypt(self, nonce: bytes, ciphertext: bytes, associated_data: bytes | None = None) -> str:
         """
-        Decrypt ciphertext using AES-256-GCM.
+        Decrypt ciphertext using the configured AEAD cipher.
 
         Args:
             nonce: 12-byte nonce used during encryption
@@ -58,16 +72,7 @@ class MessageDecryptor:
                         (message corrupted or tampered with)
             ValueError: If nonce is not 12 bytes or ciphertext is empty
         """
-        if len(nonce) != 12:
-            raise ValueError(f"Nonce must be 12 bytes, got {len(nonce)} bytes")
-
-        if not ciphertext:
-            raise ValueError("Ciphertext cannot be empty")
-
-        # Decrypt with automatic authentication tag verification
-        plaintext = self.aesgcm.decrypt(nonce, ciphertext, associated_data)
-
-        return plaintext.decode("utf-8")
+        return self.decrypt_bytes(nonce, ciphertext, associated_data).decode("utf-8")
 
     def decrypt_message(
         self, nonce: bytes, ciphertext: bytes, message_id: str | None = None
@@ -89,11 +94,34 @@ class MessageDecryptor:
         associated_data = message_id.encode("utf-8") if message_id else None
         return self.decrypt(nonce, ciphertext, associated_data)
 
+    def decrypt_message_bytes(
+        self, nonce: bytes, ciphertext: bytes, message_id: str | None = None
+    ) -> bytes:
+        """
+        Decrypt a message with optional ID as associated data, without UTF-8 decoding.
+
+        Use this when the plaintext goes straight back into binary storage
+        (e.g. a BLOB column) and a str would only be re-encoded.
+
+        Args:
+            nonce: 12-byte nonce used during encryption
+            ciphertext: Encrypted message data
+            message_id: Optional message ID used during encryption
+
+        Returns:
+            Decrypted message as raw bytes
+
+        Raises:
+            InvalidTag: If authentication fails
+        """
+        associated_data = message_id.encode("utf-8") if message_id else None
+        return self.decrypt_bytes(nonce, ciphertext, associated_data)
+
     def decrypt_bytes(
         self, nonce: bytes, ciphertext: bytes, associated_data: bytes | None = None
     ) -> bytes:
         """
-        Decrypt raw bytes using AES-256-GCM.
+        Decrypt raw bytes using the configured AEAD cipher.
 
         Args:
             nonce: 12-byte nonce used during encryption
@@ -114,7 +142,100 @@ class MessageDecryptor:
             raise ValueError("Ciphertext cannot be empty")
 
         # Decrypt with automatic authentication tag verification
-        return self.aesgcm.decrypt(nonce, ciphertext, associated_data)
+        return self._decrypt(nonce, ciphertext, associated_data)
+
+    def decrypt_many(
+        self, items: Sequence[tuple[bytes, bytes]], associated_data: bytes | None = None
+    ) -> list[str]:
+        """
+        Decrypt a batch of messages using the configured AEAD cipher.
+
+        Args:
+            items: (nonce, ciphertext) tuples as returned by MessageEncryptor.encrypt_many
+            associated_data: Optional additional authenticated data applied to every message
+
+        Returns:
+            Decrypted plaintexts as UTF-8 strings, in input order
+
+        Raises:
+            InvalidTag: If authentication fails for any message
+            ValueError: If any nonce is not 12 bytes or any ciphertext is empty
+        """
+        return self._decrypt_batch(items, [associated_data] * len(items))
+
+    def decrypt_messages(
+        self,
+        items: Sequence[tuple[bytes, bytes]],
+        message_ids: Sequence[str | None] | None = None,
+    ) -> list[str]:
+        """
+        Decrypt a batch of messages, each with the ID used during encryption.
+
+        Batch counterpart of decrypt_message.
+
+        Args:
+            items: (nonce, ciphertext) tuples as returned by MessageEncryptor.encrypt_messages
+            message_ids: Optional per-message IDs used during encryption
+
+        Returns:
+            Decrypted plaintexts as UTF-8 strings, in input order
+
+        Raises:
+            InvalidTag: If authentication fails for any message
+            ValueError: If any item is invalid or message_ids has a different length
+        """
+        if message_ids is None:
+            return self._decrypt_batch(items, [None] * len(items))
+
+        if len(message_ids) != len(items):
+            raise ValueError(f"Got {len(items)} messages but {len(message_ids)} message IDs")
+
+        aads = [mid.encode("utf-8") if mid else None for mid in message_ids]
+        return self._decrypt_batch(items, aads)
+
+    def _decrypt_batch(
+        self, items: Sequence[tuple[bytes, bytes]], aads: Sequence[bytes | None]
+    ) -> list[str]:
+        decrypt = self._decrypt
+        results = []
+
+        for i, ((nonce, ciphertext), associated_data) in enumerate(zip(items, aads, strict=True)):
+            if len(nonce) != 12:
+                raise ValueError(f"Nonce must be 12 bytes, got {len(nonce)} bytes (index {i})")
+
+            if not ciphertext:
+                raise ValueError(f"Ciphertext cannot be empty (index {i})")
+
+            results.append(decrypt(nonce, ciphertext, associated_data).decode("utf-8"))
+
+        return results
+
+    def decode_and_decrypt(self, token: str | bytes, associated_data: bytes | None = None) -> str:
+        """
+        Decode a token from MessageEncryptor.encrypt_and_encode and decrypt it.
+
+        Args:
+            token: Base64-encoded nonce || ciphertext (ASCII str or bytes)
+            associated_data: Optional additional authenticated data
+
+        Returns:
+            Decrypted plaintext as UTF-8 string
+
+        Raises:
+            InvalidTag: If authentication tag verification fails
+            ValueError: If token is not valid base64 or is too short
+        """
+        try:
+            raw = binascii.a2b_base64(token)
+        except ValueError as e:
+            raise ValueError(f"Failed to decode token: {e}") from e
+
+        if len(raw) <= 12:
+            raise ValueError("Token is too short to hold a nonce and ciphertext")
+
+        # Slice through a memoryview so the ciphertext is not copied again
+        view = memoryview(raw)
+        return self._decrypt(view[:12], view[12:], associated_data).decode("utf-8")
 
     def decrypt_safe(
         self, nonce: bytes, ciphertext: bytes, associated_data: bytes | None = None
@@ -1,5 +1,6 @@
 """
-Encryption module for platform messages using AES-256-GCM.
+Encryption module for platform messages using AES-256-GCM (default) or
+ChaCha20-Poly1305.
 
 Provides secure encryption with authenticated encryption (AEAD) to ensure
 both confidentiality and integrity of stored messages.
@@ -7,9 +8,20 @@ both confidentiality and integrity of stored messages.
 
 from __future__ import annotations
 
+import binascii
 import os
+from collections.abc import Sequence
+from typing import Literal
 
-from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM, ChaCha20Poly1305
+
+AeadAlgorithm = Literal["aes-256-gcm", "chacha20-poly1305"]
+
+# Both ciphers take a 32-byte key and a 12-byte nonce and append a 16-byte tag.
+_AEAD_CLASSES: dict[str, type[AESGCM] | type[ChaCha20Poly1305]] = {
+    "aes-256-gcm": AESGCM,
+    "chacha20-poly1305": ChaCha20Poly1305,
+}
 
 
 class MessageEncryptor:
@@ -25,29 +37,40 @@ class MessageEncryptor:
     - Never reuse nonce with the same key
     - Nonce must be 12 bytes (96 bits) for GCM
     - Authentication tag automatically appended to ciphertext
+
+    ChaCha20-Poly1305 can be selected instead, e.g. for hosts without AES
+    hardware acceleration. The decryptor must use the same algorithm.
     """
 
-    def __init__(self, key: bytes) -> None:
+    def __init__(self, key: bytes, algorithm: AeadAlgorithm = "aes-256-gcm") -> None:
         """
         Initialize encryptor with encryption key.
 
         Args:
             key: 32-byte (256-bit) encryption key
+            algorithm: AEAD cipher: "aes-256-gcm" (default) or "chacha20-poly1305"
 
         Raises:
-            ValueError: If key is not 32 bytes
+            ValueError: If key is not 32 bytes or algorithm is not supported
         """
         if len(key) != 32:
             raise ValueError(f"Key must be 32 bytes (256 bits), got {len(key)} bytes")
 
+        if algorithm not in _AEAD_CLASSES:
+            raise ValueError(f"Unsupported AEAD algorithm: {algorithm!r}")
+
         self.key = key
-        self.aesgcm = AESGCM(key)
+        self.algorithm = algorithm
+        # Kept under its historical name; holds whichever AEAD is configured.
+        self.aesgcm = _AEAD_CLASSES[algorithm](key)
+        # Bound once; encrypt paths skip the attribute lookups per message.
+        self._encrypt = self.aesgcm.encrypt
 
     def encrypt(
         self, plaintext: str | bytes, associated_data: bytes | None = None
     ) -> tuple[bytes, bytes]:
         """
-        Encrypt plaintext using AES-256-GCM.
+        Encrypt plaintext using the configured AEAD cipher.
 
         Args:
             plaintext: Message to encrypt (string or bytes)
@@ -71,9 +94,9 @@ class MessageEncryptor:
         # Generate random 96-bit nonce (12 bytes)
         nonce = os.urandom(12)
 
-        # Encrypt with AES-256-GCM
+        # Encrypt with the configured AEAD
         # The authentication tag is automatically appended to ciphertext
-        ciphertext = self.aesgcm.encrypt(nonce, plaintext, associated_data)
+        ciphertext = self._encrypt(nonce, plaintext, associated_data)
 
         return nonce, ciphertext
 
@@ -91,6 +114,73 @@ class MessageEncryptor:
         associated_data = message_id.encode("utf-8") if message_id else None
         return self.encrypt(message, associated_data)
 
+    def encrypt_many(
+        self, plaintexts: Sequence[str | bytes], associated_data: bytes | None = None
+    ) -> list[tuple[bytes, bytes]]:
+        """
+        Encrypt a batch of messages using the configured AEAD cipher.
+
+        Nonces for the whole batch are drawn with a single os.urandom call;
+        every message still gets its own random 12-byte nonce.
+
+        Args:
+            plaintexts: Messages to encrypt (strings or bytes)
+            associated_data: Optional additional authenticated data applied to every message
+
+        Returns:
+            List of (nonce, ciphertext) tuples, in input order
+
+        Raises:
+            ValueError: If any plaintext is empty after encoding
+        """
+        return self._encrypt_batch(plaintexts, [associated_data] * len(plaintexts))
+
+    def encrypt_messages(
+        self, messages: Sequence[str], message_ids: Sequence[str | None] | None = None
+    ) -> list[tuple[bytes, bytes]]:
+        """
+        Encrypt a batch of messages, each with its own ID as associated data.
+
+        Batch counterpart of encrypt_message.
+
+        Args:
+            messages: Message texts to encrypt
+            message_ids: Optional per-message IDs to authenticate (not encrypt)
+
+        Returns:
+            List of (nonce, ciphertext) tuples, in input order
+
+        Raises:
+            ValueError: If any message is empty or message_ids has a different length
+        """
+        if message_ids is None:
+            return self._encrypt_batch(messages, [None] * len(messages))
+
+        if len(message_ids) != len(messages):
+            raise ValueError(f"Got {len(messages)} messages but {len(message_ids)} message IDs")
+
+        aads = [mid.encode("utf-8") if mid else None for mid in message_ids]
+        return self._encrypt_batch(messages, aads)
+
+    def _encrypt_batch(
+        self, plaintexts: Sequence[str | bytes], aads: Sequence[bytes | None]
+    ) -> list[tuple[bytes, bytes]]:
+        encrypt = self._encrypt
+        nonces = os.urandom(12 * len(plaintexts))
+        results = []
+
+        for i, (plaintext, associated_data) in enumerate(zip(plaintexts, aads, strict=True)):
+            if isinstance(plaintext, str):
+                plaintext = plaintext.encode("utf-8")
+
+            if not plaintext:
+                raise ValueError(f"Plaintext cannot be empty (index {i})")
+
+            nonce = nonces[i * 12 : i * 12 + 12]
+            results.append((nonce, encrypt(nonce, plaintext, associated_data)))
+
+        return results
+
     @staticmethod
     def generate_key() -> bytes:
         """
@@ -109,7 +199,7 @@ class MessageEncryptor:
         self, data: bytes, associated_data: bytes | None = None
     ) -> tuple[bytes, bytes]:
         """
-        Encrypt raw bytes using AES-256-GCM.
+        Encrypt raw bytes using the configured AEAD cipher.
 
         Args:
             data: Raw bytes to encrypt
@@ -122,6 +212,28 @@ class MessageEncryptor:
             raise ValueError("Data cannot be empty")
 
         nonce = os.urandom(12)
-        ciphertext = self.aesgcm.encrypt(nonce, data, associated_data)
+        ciphertext = self._encrypt(nonce, data, associated_data)
 
         return nonce, ciphertext
+
+    def encrypt_and_encode(
+        self, plaintext: str | bytes, associated_data: bytes | None = None
+    ) -> str:
+        """
+        Encrypt plaintext and return it as a single base64 token.
+
+        The token is base64(nonce || ciphertext), so it can be stored or sent
+        as one text field and passed back to MessageDecryptor.decode_and_decrypt.
+
+        Args:
+            plaintext: Message to encrypt (string or bytes)
+            associated_data: Optional additional authenticated data
+
+        Returns:
+            Base64-encoded token as an ASCII string
+
+        Raises:
+            ValueError: If plaintext is empty after encoding
+        """
+        nonce, ciphertext = self.encrypt(plaintext, associated_data)
+        return binascii.b2a_base64(nonce + ciphertext, newline=False).decode("ascii")
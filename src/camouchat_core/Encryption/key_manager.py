@@ -1,22 +1,37 @@
 """
 Key management module for platform message encryption.
 
-Handles key derivation from user passwords using PBKDF2-HMAC,
-a secure key derivation function with configurable iterations.
+Handles key derivation from user passwords using PBKDF2-HMAC (default),
+scrypt or Argon2id.
 """
 
 from __future__ import annotations
 
-import base64
+import binascii
+import hashlib
+import hmac
 import os
+import threading
+from collections import OrderedDict
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
+from typing import Literal
 
 from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.kdf.argon2 import Argon2id
 from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
+from cryptography.hazmat.primitives.kdf.scrypt import Scrypt
+
+KdfAlgorithm = Literal["pbkdf2", "scrypt", "argon2id"]
+
+# Per-process secret for the derived-key cache; cache keys are never a
+# plain (crackable) hash of the password.
+_CACHE_SECRET = os.urandom(32)
 
 
 class KeyManager:
     """
-    Manages encryption key derivation using PBKDF2-HMAC.
+    Manages encryption key derivation using PBKDF2-HMAC, scrypt or Argon2id.
 
     PBKDF2-HMAC provides:
     - Secure key derivation from passwords
@@ -27,25 +42,51 @@ class KeyManager:
     - Each user has a unique salt
     - Keys are derived from user passwords
     - Same password + salt always produces same key
+
+    Derived keys are kept in a small in-memory LRU cache, so repeated
+    derivations of the same password + salt skip the PBKDF2 run. The cache
+    is keyed by a BLAKE2b MAC of the password under a per-process secret,
+    never the password itself or an unkeyed hash of it.
     """
 
-    def __init__(self, iterations: int = 480000) -> None:
+    def __init__(
+        self,
+        iterations: int = 480000,
+        cache_size: int = 32,
+        algorithm: KdfAlgorithm = "pbkdf2",
+    ) -> None:
         """
-        Initialize key manager with PBKDF2 parameters.
+        Initialize key manager with KDF parameters.
 
         Args:
-            iterations: Number of iterations (default: 480000, recommended by OWASP)
+            iterations: Number of PBKDF2 iterations (default: 480000, recommended by OWASP)
                        Higher values increase security but slow down key derivation.
+                       Ignored by scrypt and Argon2id.
+            cache_size: Maximum number of derived keys kept in memory (0 disables caching)
+            algorithm: Key derivation function: "pbkdf2" (default), "scrypt" or "argon2id"
+
+        Raises:
+            ValueError: If algorithm is not supported
 
         Note:
             480000 iterations is OWASP recommended for PBKDF2-HMAC-SHA256.
-            Adjust based on your security requirements and performance needs.
+            scrypt uses N=2**17, r=8, p=1 and Argon2id uses 19 MiB, t=2, p=1,
+            the OWASP recommended settings for each. Keys derived with
+            different algorithms differ, so keep using the algorithm your
+            stored salts were created with.
         """
+        if algorithm not in ("pbkdf2", "scrypt", "argon2id"):
+            raise ValueError(f"Unsupported KDF algorithm: {algorithm!r}")
+
         self.iterations = iterations
+        self.cache_size = cache_size
+        self.algorithm = algorithm
+        self._cache: OrderedDict[tuple[bytes, bytes, str, int], bytes] = OrderedDict()
+        self._cache_lock = threading.Lock()
 
     def derive_key_and_salt(self, password: str, salt: bytes | None = None) -> tuple[bytes, bytes]:
         """
-        Derive an encryption key from password using PBKDF2-HMAC.
+        Derive an encryption key from password using the configured KDF.
 
         Args:
             password: User password
@@ -72,19 +113,39 @@ class KeyManager:
         # Convert password to bytes
         password_bytes = password.encode("utf-8")
 
-        # Create PBKDF2-HMAC-SHA256 KDF instance
-        kdf = PBKDF2HMAC(
+        password_hash = hashlib.blake2b(password_bytes, key=_CACHE_SECRET, digest_size=32).digest()
+        cache_key = (password_hash, salt, self.algorithm, self.iterations)
+        with self._cache_lock:
+            cached = self._cache.get(cache_key)
+            if cached is not None:
+                self._cache.move_to_end(cache_key)
+                return salt, cached
+
+        # Derive 256-bit key for AES-256
+        key = self._create_kdf(salt).derive(password_bytes)
+
+        if self.cache_size > 0:
+            with self._cache_lock:
+                self._cache[cache_key] = key
+                while len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+
+        return salt, key
+
+    def _create_kdf(self, salt: bytes) -> PBKDF2HMAC | Scrypt | Argon2id:
+        if self.algorithm == "scrypt":
+            return Scrypt(salt=salt, length=32, n=2**17, r=8, p=1)
+
+        if self.algorithm == "argon2id":
+            return Argon2id(salt=salt, length=32, iterations=2, lanes=1, memory_cost=19 * 1024)
+
+        return PBKDF2HMAC(
             algorithm=hashes.SHA256(),
-            length=32,  # 256-bit key for AES-256
+            length=32,
             salt=salt,
             iterations=self.iterations,
         )
 
-        # Derive key
-        key = kdf.derive(password_bytes)
-
-        return salt, key
-
     def derive_key(self, password: str, salt: bytes) -> bytes:
         """
         Derive an encryption key from password and existing salt.
@@ -102,6 +163,70 @@ class KeyManager:
         _, key = self.derive_key_and_salt(password, salt)
         return key
 
+    def verify_key(self, password: str, salt: bytes, expected_key: bytes) -> bool:
+        """
+        Check whether a password and salt derive the expected key.
+
+        Args:
+            password: User password
+            salt: 16-byte salt used during original key derivation
+            expected_key: Previously derived 32-byte key
+
+        Returns:
+            True if the derived key matches, False otherwise
+
+        Raises:
+            ValueError: If password is empty or salt is not 16 bytes
+
+        Note:
+            The comparison uses hmac.compare_digest, so its timing does not
+            reveal how many leading bytes matched.
+        """
+        return hmac.compare_digest(self.derive_key(password, salt), expected_key)
+
+    def derive_keys(
+        self, pairs: Sequence[tuple[str, bytes]], max_workers: int | None = None
+    ) -> list[bytes]:
+        """
+        Derive encryption keys for many (password, salt) pairs in parallel.
+
+        PBKDF2 runs inside OpenSSL with the GIL released, so a thread pool
+        spreads independent derivations (e.g. bulk user imports) across cores.
+        scrypt and Argon2id hold the GIL, so with those the batch effectively
+        runs serially.
+
+        Args:
+            pairs: (password, 16-byte salt) tuples
+            max_workers: Thread count (default: min(len(pairs), CPU count))
+
+        Returns:
+            32-byte derived keys, in input order
+
+        Raises:
+            ValueError: If any password is empty, any salt is not 16 bytes
+                        or max_workers is not positive
+        """
+        if max_workers is not None and max_workers <= 0:
+            raise ValueError("max_workers must be greater than 0")
+
+        if len(pairs) <= 1:
+            return [self.derive_key(password, salt) for password, salt in pairs]
+
+        workers = min(len(pairs), os.cpu_count() or 1) if max_workers is None else max_workers
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(lambda pair: self.derive_key(*pair), pairs))
+
+    def clear_cache(self) -> None:
+        """
+        Drop all cached derived keys.
+
+        Note:
+            Call this when key material should no longer be held in memory
+            (e.g. after a user logs out).
+        """
+        with self._cache_lock:
+            self._cache.clear()
+
     @staticmethod
     def generate_random_key() -> bytes:
         """
@@ -131,7 +256,7 @@ class KeyManager:
             Encoded keys can be stored in config files or databases.
             Never store raw keys or passwords in plaintext.
         """
-        return base64.b64encode(key).decode("utf-8")
+        return KeyManager.encode_key_bytes(key).decode("ascii")
 
     @staticmethod
     def decode_key_from_storage(encoded_key: str) -> bytes:
@@ -144,10 +269,39 @@ class KeyManager:
         Returns:
             Raw 32-byte key
 
+        Raises:
+            ValueError: If encoded_key is invalid
+        """
+        return KeyManager.decode_key_bytes(encoded_key)
+
+    @staticmethod
+    def encode_key_bytes(key: bytes) -> bytes:
+        """
+        Encode a key for binary storage (e.g. a BLOB column).
+
+        Args:
+            key: Raw 32-byte key
+
+        Returns:
+            Base64-encoded key as ASCII bytes
+        """
+        return binascii.b2a_base64(key, newline=False)
+
+    @staticmethod
+    def decode_key_bytes(encoded_key: bytes | str) -> bytes:
+        """
+        Decode a key from binary storage without a str round-trip.
+
+        Args:
+            encoded_key: Base64-encoded key (ASCII bytes or str)
+
+        Returns:
+            Raw 32-byte key
+
         Raises:
             ValueError: If encoded_key is invalid
         """
         try:
-            return base64.b64decode(encoded_key.encode("utf-8"))
+            return binascii.a2b_base64(encoded_key)
         except Exception as e:
             raise ValueError(f"Failed to decode key: {e}") from e
@@ -2,26 +2,9 @@
 
 __version__ = "0.7.3"
 
+import importlib
+from typing import TYPE_CHECKING, Any
 
-# Contracts
-from .contracts import (
-    ChatProcessorProtocol,
-    ChatProtocol,
-    InteractionControllerProtocol,
-    LoginProtocol,
-    MediaControllerProtocol,
-    MessageProcessorProtocol,
-    MessageProtocol,
-    StorageProtocol,
-    UiConfigProtocol,
-)
-
-# Encryption
-from .Encryption import (
-    KeyManager,
-    MessageDecryptor,
-    MessageEncryptor,
-)
 from .Exceptions import CamouChatError
 
 # Metadata
@@ -30,6 +13,42 @@ from .global_metadata import MediaType, MessageType, Platform, StorageType
 # Logging
 from .logger import CamouAdapter, LoggerFactory
 
+# Contracts and Encryption (loaded on first access, see __getattr__)
+if TYPE_CHECKING:
+    from .contracts import (
+        BulkStorageProtocol,
+        ChatProcessorProtocol,
+        ChatProtocol,
+        InteractionControllerProtocol,
+        LoginProtocol,
+        MediaControllerProtocol,
+        MessageProcessorProtocol,
+        MessageProtocol,
+        StorageProtocol,
+        UiConfigProtocol,
+    )
+    from .Encryption import (
+        KeyManager,
+        MessageDecryptor,
+        MessageEncryptor,
+    )
+
+_LAZY = {
+    "ChatProtocol": ".contracts",
+    "MessageProtocol": ".contracts",
+    "StorageProtocol": ".contracts",
+    "BulkStorageProtocol": ".contracts",
+    "LoginProtocol": ".contracts",
+    "InteractionControllerProtocol": ".contracts",
+    "MediaControllerProtocol": ".contracts",
+    "UiConfigProtocol": ".contracts",
+    "MessageProcessorProtocol": ".contracts",
+    "ChatProcessorProtocol": ".contracts",
+    "MessageEncryptor": ".Encryption",
+    "MessageDecryptor": ".Encryption",
+    "KeyManager": ".Encryption",
+}
+
 __all__ = [
     # Metadata
     "Platform",
@@ -40,6 +59,7 @@ __all__ = [
     "ChatProtocol",
     "MessageProtocol",
     "StorageProtocol",
+    "BulkStorageProtocol",
     "LoginProtocol",
     "InteractionControllerProtocol",
     "MediaControllerProtocol",
@@ -56,3 +76,15 @@ __all__ = [
     "LoggerFactory",
     "CamouAdapter",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY:
+        value = getattr(importlib.import_module(_LAZY[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -2,17 +2,35 @@
 Contracts for platform & browser based plugins.
 
 @runtime_checkable added for chat , message, storage protocols for runtime checking.
+Protocol modules are imported on first attribute access (PEP 562).
 """
 
-from .chat import ChatProtocol
-from .chat_processor import ChatProcessorProtocol
-from .interaction_controller import InteractionControllerProtocol
-from .login import LoginProtocol
-from .media_controller import MediaControllerProtocol
-from .message import MessageProtocol
-from .message_processor import MessageProcessorProtocol
-from .storage import StorageProtocol
-from .ui_config import UiConfigProtocol
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .chat import ChatProtocol
+    from .chat_processor import ChatProcessorProtocol
+    from .interaction_controller import InteractionControllerProtocol
+    from .login import LoginProtocol
+    from .media_controller import MediaControllerProtocol
+    from .message import MessageProtocol
+    from .message_processor import MessageProcessorProtocol
+    from .storage import BulkStorageProtocol, StorageProtocol
+    from .ui_config import UiConfigProtocol
+
+_LAZY = {
+    "ChatProtocol": ".chat",
+    "ChatProcessorProtocol": ".chat_processor",
+    "InteractionControllerProtocol": ".interaction_controller",
+    "LoginProtocol": ".login",
+    "MediaControllerProtocol": ".media_controller",
+    "MessageProtocol": ".message",
+    "MessageProcessorProtocol": ".message_processor",
+    "StorageProtocol": ".storage",
+    "BulkStorageProtocol": ".storage",
+    "UiConfigProtocol": ".ui_config",
+}
 
 __all__ = [
     "ChatProcessorProtocol",
@@ -23,5 +41,18 @@ __all__ = [
     "InteractionControllerProtocol",
     "UiConfigProtocol",
     "StorageProtocol",
+    "BulkStorageProtocol",
     "LoginProtocol",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY:
+        value = getattr(importlib.import_module(_LAZY[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
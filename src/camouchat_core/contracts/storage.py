@@ -49,3 +49,17 @@ class StorageProtocol(Protocol):
     async def close_db(self, **kwargs) -> None:
         """Close database connection and cleanup resources."""
         ...
+
+
+@runtime_checkable
+class BulkStorageProtocol(StorageProtocol, Protocol):
+    """Optional extension for storage backends with bulk duplicate checks.
+
+    Kept separate from StorageProtocol so existing backends still satisfy the
+    base contract; callers feature-check with ``isinstance(storage,
+    BulkStorageProtocol)`` and fall back to per-message lookups otherwise.
+    """
+
+    async def check_messages_exist_async(self, msg_ids: Sequence[str], **kwargs) -> set[str]:
+        """Return the subset of msg_ids already stored, in a single lookup."""
+        ...
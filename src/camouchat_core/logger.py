@@ -1,8 +1,12 @@
+import atexit
 import json
 import logging
 import os
+import queue
 import sys
-from logging.handlers import RotatingFileHandler
+import threading
+import time
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from typing import Any
 
 try:
@@ -19,6 +23,8 @@ except ImportError:
 class JSONFormatter(logging.Formatter):
     """Formatter that outputs log records as JSON objects."""
 
+    CONTEXT_FIELDS = ("profile_id", "process_id", "platform")
+
     def format(self, record: logging.LogRecord) -> str:
         log_record = {
             "timestamp": self.formatTime(record, self.datefmt),
@@ -26,10 +32,11 @@ class JSONFormatter(logging.Formatter):
             "logger": record.name,
             "message": record.getMessage(),
         }
-        # Add profile/process metadata if present
-        for attr in ["profile_id", "process_id", "platform"]:
-            if hasattr(record, attr):
-                log_record[attr] = getattr(record, attr)
+        # Add profile/process metadata if present (injected via `extra`, so it lives in __dict__)
+        attrs = record.__dict__
+        for attr in self.CONTEXT_FIELDS:
+            if attr in attrs:
+                log_record[attr] = attrs[attr]
 
         if record.exc_info:
             log_record["exception"] = self.formatException(record.exc_info)
@@ -50,10 +57,45 @@ class CamouAdapter(logging.LoggerAdapter):
         return msg, kwargs
 
 
+# Python 3.12 returns from Thread.join() slightly before the OS thread is gone,
+# yet counts OS threads (via /proc) when deciding to warn about fork.
+_WAIT_FOR_OS_THREAD_EXIT = sys.version_info[:2] == (3, 12) and os.path.isdir("/proc/self/task")
+
+
+def _os_thread_count() -> int:
+    return len(os.listdir("/proc/self/task"))
+
+
+def _wait_for_os_thread_exit(count_before: int, timeout: float = 0.1) -> None:
+    deadline = time.monotonic() + timeout
+    while _os_thread_count() >= count_before and time.monotonic() < deadline:
+        time.sleep(0.0001)
+
+
+class _ForkAwareQueueHandler(QueueHandler):
+    """QueueHandler that restarts the listener paused around a fork on the next record."""
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        super().enqueue(record)
+        if LoggerFactory._listener_paused:
+            LoggerFactory._resume_listener()
+
+
 class LoggerFactory:
     """
     Centralizing logging infrastructure for all CamouChat plugins.
     Ensures standard formatting, rotation, and colors.
+
+    Records are handed to a QueueHandler on the ``camouchat`` root logger; a
+    background QueueListener thread owns the console/file handlers. The calling
+    thread still formats the record (QueueHandler.prepare), but console and
+    disk I/O happen on the listener thread.
+
+    Around ``fork`` the listener is stopped (draining the queue) so no helper
+    thread is alive when the process forks. The parent restarts it on its next
+    record, not inside the fork hooks, which Python 3.13 still counts as
+    multi-threaded; the child writes to the inherited console/file handlers
+    directly.
     """
 
     LOG_FORMAT = "%(asctime)s | %(levelname)s | [%(platform)s][%(profile_id)s][%(process_id)s] | %(name)s | %(message)s"
@@ -63,6 +105,9 @@ class LoggerFactory:
 
     _root_initialized = False
     _handlers: dict[str, logging.Handler] = {}
+    _listener: QueueListener | None = None
+    _listener_paused = False
+    _init_lock = threading.Lock()
 
     @classmethod
     def set_level(cls, level: int | str) -> None:
@@ -91,9 +136,13 @@ class LoggerFactory:
         logger_name = f"camouchat.{name}"
         logger = logging.getLogger(logger_name)
 
+        # Handlers are built once, on first use; the lock keeps concurrent
+        # first calls from registering them twice.
         if not self._root_initialized:
-            self._setup_root_handlers(log_file)
-            self._root_initialized = True
+            with self._init_lock:
+                if not self._root_initialized:
+                    self._setup_root_handlers(log_file)
+                    self._root_initialized = True
 
         if level:
             logger.setLevel(level)
@@ -128,15 +177,133 @@ class LoggerFactory:
                 },
             )
             c_handler.setFormatter(c_formatter)
-            root.addHandler(c_handler)
             cls._handlers["console"] = c_handler
 
         # File Handler (Optional)
         if log_file and "file" not in cls._handlers:
             os.makedirs(os.path.dirname(log_file), exist_ok=True)
-            f_handler = ConcurrentRotatingFileHandler(
-                log_file, maxBytes=10 * 1024 * 1024, backupCount=5
-            )
+            f_kwargs: dict[str, Any] = {
+                "maxBytes": 10 * 1024 * 1024,
+                "backupCount": 5,
+                "encoding": "utf-8",
+            }
+            # Open the file on the first emitted record, not here.
+            # concurrent_log_handler always does this; the stdlib fallback needs delay=True.
+            if ConcurrentRotatingFileHandler is RotatingFileHandler:
+                f_kwargs["delay"] = True
+            f_handler = ConcurrentRotatingFileHandler(log_file, **f_kwargs)
             f_handler.setFormatter(logging.Formatter(cls.LOG_FORMAT))
-            root.addHandler(f_handler)
             cls._handlers["file"] = f_handler
+
+        # Queue Handler (the only handler the calling threads touch)
+        if "queue" not in cls._handlers:
+            log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+            q_handler = _ForkAwareQueueHandler(log_queue)
+            root.addHandler(q_handler)
+            cls._handlers["queue"] = q_handler
+
+            sinks = [h for key, h in cls._handlers.items() if key != "queue"]
+            cls._listener = QueueListener(log_queue, *sinks, respect_handler_level=True)
+            cls._listener.start()
+
+    @classmethod
+    def _before_fork(cls) -> None:
+        """Drains and stops the listener thread so the process forks single-threaded."""
+        # Held across fork so no other thread can set the handlers up meanwhile;
+        # released again by _after_fork_in_parent / _reinit_after_fork.
+        cls._init_lock.acquire()
+        if cls._listener is not None and not cls._listener_paused:
+            count_before = _os_thread_count() if _WAIT_FOR_OS_THREAD_EXIT else 0
+            cls._listener.stop()
+            cls._listener_paused = True
+            if count_before:
+                _wait_for_os_thread_exit(count_before)
+
+    @classmethod
+    def _after_fork_in_parent(cls) -> None:
+        """Releases the lock taken by _before_fork; the next record restarts the listener."""
+        cls._init_lock.release()
+
+    @classmethod
+    def _resume_listener(cls) -> None:
+        """Restarts the listener paused by _before_fork."""
+        with cls._init_lock:
+            if cls._listener_paused and cls._listener is not None:
+                cls._listener.start()
+            cls._listener_paused = False
+
+    @classmethod
+    def _reinit_after_fork(cls) -> None:
+        """Swaps the stopped listener's QueueHandler for the inherited sinks in a forked child."""
+        try:
+            q_handler = cls._handlers.pop("queue", None)
+            cls._listener = None
+            cls._listener_paused = False
+            if q_handler is None:
+                return
+
+            root = logging.getLogger("camouchat")
+            root.removeHandler(q_handler)
+            for handler in cls._handlers.values():
+                root.addHandler(handler)
+        finally:
+            cls._init_lock.release()
+
+    @classmethod
+    def shutdown(cls) -> None:
+        """
+        Stops the listener thread after draining queued records and detaches all handlers.
+
+        The next ``get_logger`` call sets the handlers up again.
+        """
+        if cls._listener is not None:
+            if cls._listener_paused:
+                # Stopped around a fork and not restarted since; drain on this thread,
+                # which also works at interpreter exit where no thread can be started.
+                while True:
+                    try:
+                        record = cls._listener.dequeue(False)
+                    except queue.Empty:
+                        break
+                    cls._listener.handle(record)
+                cls._listener_paused = False
+            else:
+                cls._listener.stop()
+            cls._listener = None
+
+        root = logging.getLogger("camouchat")
+        for handler in cls._handlers.values():
+            root.removeHandler(handler)
+            handler.close()
+
+        cls._handlers = {}
+        cls._root_initialized = False
+
+
+# Hooks look LoggerFactory up at call time and are registered once, so
+# reloading this module neither stacks them nor leaves them on a stale class.
+def _shutdown_at_exit() -> None:
+    LoggerFactory.shutdown()
+
+
+def _before_fork() -> None:
+    LoggerFactory._before_fork()
+
+
+def _after_fork_in_parent() -> None:
+    LoggerFactory._after_fork_in_parent()
+
+
+def _after_fork_in_child() -> None:
+    LoggerFactory._reinit_after_fork()
+
+
+if not globals().get("_HOOKS_REGISTERED"):
+    atexit.register(_shutdown_at_exit)
+    if hasattr(os, "register_at_fork"):
+        os.register_at_fork(
+            before=_before_fork,
+            after_in_parent=_after_fork_in_parent,
+            after_in_child=_after_fork_in_child,
+        )
+    _HOOKS_REGISTERED = True
@@ -5,6 +5,11 @@ Tests for MessageEncryptor, MessageDecryptor, and KeyManager.
 """
 
 import base64
+import hashlib
+import os
+import subprocess
+import sys
+from unittest.mock import patch
 
 import pytest
 from cryptography.exceptions import InvalidTag
@@ -28,6 +33,16 @@ class TestKeyManager:
         decoded = KeyManager.decode_key_from_storage(encoded)
         assert key == decoded, "Decoded key should match original"
 
+    def test_encode_decode_key_bytes(self):
+        """Test binary key encoding and decoding."""
+        key = KeyManager.generate_random_key()
+        encoded = KeyManager.encode_key_bytes(key)
+        assert isinstance(encoded, bytes)
+        assert encoded.decode("ascii") == KeyManager.encode_key_for_storage(key)
+        assert KeyManager.decode_key_bytes(encoded) == key
+        with pytest.raises(ValueError):
+            KeyManager.decode_key_bytes(b"not_base64!!!")
+
     def test_derive_key_with_salt(self):
         """Test key derivation with provided salt."""
         key_manager = KeyManager()
@@ -40,13 +55,100 @@ class TestKeyManager:
 
     def test_derive_key_without_salt(self):
         """Test key derivation generates random salt."""
-        key_manager = KeyManager()
+        key_manager = KeyManager(iterations=1000)
         password = "test_password"
         salt1, key1 = key_manager.derive_key_and_salt(password)
         salt2, key2 = key_manager.derive_key_and_salt(password)
         assert salt1 != salt2, "Different salts should be generated"
         assert key1 != key2, "Different salts should produce different keys"
 
+    def test_derive_key_is_cached(self):
+        """Test that repeated derivations with the same password and salt reuse the cached key."""
+        from camouchat_core.Encryption import key_manager
+
+        manager = KeyManager(iterations=1000)
+        with patch.object(key_manager, "PBKDF2HMAC", wraps=key_manager.PBKDF2HMAC) as kdf_cls:
+            salt, key1 = manager.derive_key_and_salt("password")
+            key2 = manager.derive_key("password", salt)
+            key3 = manager.derive_key("other_password", salt)
+            assert kdf_cls.call_count == 2, "Second derivation should hit the cache"
+
+            manager.clear_cache()
+            assert manager.derive_key("password", salt) == key1
+            assert kdf_cls.call_count == 3, "Cleared cache should derive again"
+
+        assert key1 == key2
+        assert key1 != key3
+
+    def test_derive_key_cache_is_bounded(self):
+        """Test that the derived key cache evicts the least recently used entry."""
+        key_manager = KeyManager(iterations=1000, cache_size=2)
+        salt_a, salt_b, salt_c = (bytes([i]) * 16 for i in range(3))
+        with patch.object(key_manager, "_create_kdf", wraps=key_manager._create_kdf) as kdf:
+            key_manager.derive_key("password", salt_a)
+            key_manager.derive_key("password", salt_b)
+            key_manager.derive_key("password", salt_a)  # hit: A becomes most recently used
+            key_manager.derive_key("password", salt_c)  # evicts B, not A
+            assert kdf.call_count == 3
+            assert {cache_key[1] for cache_key in key_manager._cache} == {salt_a, salt_c}
+
+            key_manager.derive_key("password", salt_a)
+            key_manager.derive_key("password", salt_c)
+            assert kdf.call_count == 3
+            key_manager.derive_key("password", salt_b)
+            assert kdf.call_count == 4
+        assert len(key_manager._cache) == 2
+
+        no_cache = KeyManager(iterations=1000, cache_size=0)
+        no_cache.derive_key("password", salt_a)
+        assert len(no_cache._cache) == 0
+
+    def test_derive_key_cache_does_not_store_plain_hash(self):
+        """Test that cache keys are not an unkeyed hash of the password."""
+        key_manager = KeyManager(iterations=1000)
+        key_manager.derive_key("password", os.urandom(16))
+
+        password_hash = next(iter(key_manager._cache))[0]
+        assert password_hash != hashlib.sha256(b"password").digest()
+        assert password_hash != hashlib.blake2b(b"password", digest_size=32).digest()
+
+    def test_derive_key_algorithms(self):
+        """Test that scrypt and Argon2id derive distinct 32-byte keys."""
+        salt = os.urandom(16)
+        keys = set()
+        for algorithm in ("pbkdf2", "scrypt", "argon2id"):
+            key = KeyManager(iterations=1000, algorithm=algorithm).derive_key("password", salt)
+            assert len(key) == 32
+            keys.add(key)
+        assert len(keys) == 3, "Each algorithm should produce a different key"
+
+        with pytest.raises(ValueError, match="Unsupported KDF algorithm"):
+            KeyManager(algorithm="md5")  # type: ignore[arg-type]
+
+    def test_derive_keys(self):
+        """Test that bulk derivation matches one-by-one derivation."""
+        key_manager = KeyManager(iterations=1000, cache_size=0)
+        pairs = [(f"password_{i}", bytes([i]) * 16) for i in range(4)]
+        keys = key_manager.derive_keys(pairs, max_workers=2)
+        assert keys == [key_manager.derive_key(p, s) for p, s in pairs]
+        assert key_manager.derive_keys([]) == []
+        with pytest.raises(ValueError):
+            key_manager.derive_keys([("password", b"0" * 16), ("", b"0" * 16)])
+        with pytest.raises(ValueError, match="max_workers"):
+            key_manager.derive_keys(pairs, max_workers=0)
+        with pytest.raises(ValueError, match="max_workers"):
+            key_manager.derive_keys(pairs[:1], max_workers=0)
+
+    def test_verify_key(self):
+        """Test password verification against a previously derived key."""
+        key_manager = KeyManager(iterations=1000)
+        salt, key = key_manager.derive_key_and_salt("password")
+        assert key_manager.verify_key("password", salt, key)
+        assert not key_manager.verify_key("wrong_password", salt, key)
+        assert not key_manager.verify_key("password", os.urandom(16), key)
+        with pytest.raises(ValueError):
+            key_manager.verify_key("", salt, key)
+
     def test_empty_password_raises_error(self):
         """Test that empty password raises ValueError."""
         key_manager = KeyManager()
@@ -116,6 +218,36 @@ class TestMessageEncryptor:
         unique_nonces = set(nonces)
         assert len(unique_nonces) == 100, "All nonces should be unique"
 
+    def test_encrypt_many(self):
+        """Test that batch encryption returns one unique nonce per message."""
+        key = KeyManager.generate_random_key()
+        encryptor = MessageEncryptor(key)
+        results = encryptor.encrypt_many(["a", b"b", "c"])
+        assert len(results) == 3
+        assert all(len(nonce) == 12 for nonce, _ in results)
+        assert len({nonce for nonce, _ in results}) == 3, "Nonces should be unique"
+        assert encryptor.encrypt_many([]) == []
+
+    def test_encrypt_many_empty_message_raises_error(self):
+        """Test that an empty message anywhere in the batch raises ValueError."""
+        key = KeyManager.generate_random_key()
+        encryptor = MessageEncryptor(key)
+        with pytest.raises(ValueError, match="index 1"):
+            encryptor.encrypt_many(["ok", ""])
+
+    def test_encrypt_messages(self):
+        """Test that batch message encryption matches encrypt_message per item."""
+        key = KeyManager.generate_random_key()
+        encryptor = MessageEncryptor(key)
+        decryptor = MessageDecryptor(key)
+        results = encryptor.encrypt_messages(["a", "b", "c"], ["id1", None, "id3"])
+        assert len({nonce for nonce, _ in results}) == 3, "Nonces should be unique"
+        assert decryptor.decrypt_message(*results[0], "id1") == "a"
+        assert decryptor.decrypt_message(*results[1]) == "b"
+        assert len(encryptor.encrypt_messages(["a", "b"])) == 2
+        with pytest.raises(ValueError, match="2 messages but 1 message IDs"):
+            encryptor.encrypt_messages(["a", "b"], ["id1"])
+
     def test_generate_static_key(self):
         """Test the static generate_key method."""
         key = MessageEncryptor.generate_key()
@@ -150,6 +282,17 @@ class TestMessageDecryptor:
         decrypted = decryptor.decrypt_bytes(nonce, ciphertext)
         assert decrypted == data, "Decrypted bytes should match original"
 
+    def test_decrypt_message_bytes(self):
+        """Test decrypting a message with ID to raw bytes."""
+        key = KeyManager.generate_random_key()
+        encryptor = MessageEncryptor(key)
+        decryptor = MessageDecryptor(key)
+        nonce, ciphertext = encryptor.encrypt_message("héllo", "msg_1")
+        plaintext = decryptor.decrypt_message_bytes(nonce, ciphertext, "msg_1")
+        assert plaintext == "héllo".encode()
+        with pytest.raises(InvalidTag):
+            decryptor.decrypt_message_bytes(nonce, ciphertext, "msg_2")
+
     def test_decrypt_with_wrong_key_fails(self):
         """Test that decrypting with wrong key fails."""
         key1 = KeyManager.generate_random_key()
@@ -201,6 +344,41 @@ class TestMessageDecryptor:
         with pytest.raises(InvalidTag):  # InvalidTag
             decryptor.decrypt_message(nonce, modified_ciphertext)
 
+    def test_decrypt_many(self):
+        """Test batch decryption round-trips batch encryption."""
+        key = KeyManager.generate_random_key()
+        encryptor = MessageEncryptor(key)
+        decryptor = MessageDecryptor(key)
+        messages = ["Hello", "World", "Test", "Message"]
+        items = encryptor.encrypt_many(messages, b"chat_1")
+        assert decryptor.decrypt_many(items, b"chat_1") == messages
+        with pytest.raises(InvalidTag):
+            decryptor.decrypt_many(items, b"chat_2")
+
+    def test_decrypt_many_invalid_input_raises_error(self):
+        """Test that batch decryption validates every item."""
+        key = KeyManager.generate_random_key()
+        decryptor = MessageDecryptor(key)
+        with pytest.raises(ValueError, match="Nonce must be 12 bytes"):
+            decryptor.decrypt_many([(b"short", b"data")])
+        with pytest.raises(ValueError, match="Ciphertext cannot be empty"):
+            decryptor.decrypt_many([(b"0" * 12, b"")])
+
+    def test_decrypt_messages(self):
+        """Test batch message decryption with per-message IDs."""
+        key = KeyManager.generate_random_key()
+        encryptor = MessageEncryptor(key)
+        decryptor = MessageDecryptor(key)
+        messages = ["Hello", "World"]
+        message_ids = ["msg_1", "msg_2"]
+        items = encryptor.encrypt_messages(messages, message_ids)
+        assert decryptor.decrypt_messages(items, message_ids) == messages
+        assert decryptor.decrypt_messages(encryptor.encrypt_messages(messages)) == messages
+        with pytest.raises(InvalidTag):
+            decryptor.decrypt_messages(items, message_ids[::-1])
+        with pytest.raises(ValueError, match="2 messages but 1 message IDs"):
+            decryptor.decrypt_messages(items, ["msg_1"])
+
     def test_decrypt_safe_returns_none_on_failure(self):
         """Test that decrypt_safe returns None on failure."""
         key = KeyManager.generate_random_key()
@@ -218,7 +396,7 @@ class TestEncryptionIntegration:
 
     def test_full_workflow_with_key_manager(self):
         """Test full encryption/decryption workflow with KeyManager."""
-        key_manager = KeyManager()
+        key_manager = KeyManager(iterations=1000)
         password = "user_password_123"
         salt, key = key_manager.derive_key_and_salt(password)
 
@@ -236,9 +414,26 @@ class TestEncryptionIntegration:
 
         assert plaintext == "Secret message", "Full workflow should work correctly"
 
+    def test_encrypt_and_encode_round_trip(self):
+        """Test the single-token encrypt+base64 and decode+decrypt helpers."""
+        key = KeyManager.generate_random_key()
+        encryptor = MessageEncryptor(key)
+        decryptor = MessageDecryptor(key)
+        token = encryptor.encrypt_and_encode("Secret message", b"msg_123")
+        assert isinstance(token, str)
+        assert decryptor.decode_and_decrypt(token, b"msg_123") == "Secret message"
+        assert decryptor.decode_and_decrypt(token.encode("ascii"), b"msg_123") == "Secret message"
+
+        with pytest.raises(InvalidTag):
+            decryptor.decode_and_decrypt(token, b"msg_456")
+        with pytest.raises(ValueError, match="Failed to decode token"):
+            decryptor.decode_and_decrypt("not_base64!!!")
+        with pytest.raises(ValueError, match="too short"):
+            decryptor.decode_and_decrypt(base64.b64encode(b"0" * 12).decode("ascii"))
+
     def test_multiple_messages_same_key(self):
         """Test encrypting/decrypting multiple messages with same key."""
-        key_manager = KeyManager()
+        key_manager = KeyManager(iterations=1000)
         salt, key = key_manager.derive_key_and_salt("password")
         encryptor = MessageEncryptor(key)
         decryptor = MessageDecryptor(key)
@@ -252,3 +447,51 @@ class TestEncryptionIntegration:
             results.append(plaintext)
 
         assert results == messages, "All messages should be encrypted and decrypted correctly"
+
+    def test_aead_algorithms_round_trip(self):
+        """Test that both AEAD ciphers round-trip and are not interchangeable."""
+        key = KeyManager.generate_random_key()
+        for algorithm in ("aes-256-gcm", "chacha20-poly1305"):
+            encryptor = MessageEncryptor(key, algorithm=algorithm)
+            decryptor = MessageDecryptor(key, algorithm=algorithm)
+            nonce, ciphertext = encryptor.encrypt_message("Secret message", "msg_123")
+            assert decryptor.decrypt_message(nonce, ciphertext, "msg_123") == "Secret message"
+            items = encryptor.encrypt_many(["a", "b"])
+            assert decryptor.decrypt_many(items) == ["a", "b"]
+
+        nonce, ciphertext = MessageEncryptor(key, algorithm="chacha20-poly1305").encrypt("x")
+        with pytest.raises(InvalidTag):
+            MessageDecryptor(key).decrypt(nonce, ciphertext)
+
+        with pytest.raises(ValueError, match="Unsupported AEAD algorithm"):
+            MessageEncryptor(key, algorithm="aes-128-cbc")  # type: ignore[arg-type]
+        with pytest.raises(ValueError, match="Unsupported AEAD algorithm"):
+            MessageDecryptor(key, algorithm="aes-128-cbc")  # type: ignore[arg-type]
+
+
+class TestLazyImport:
+    """Encryption classes are only imported on first access."""
+
+    def test_import_does_not_load_cryptography(self):
+        """Test that importing the SDK defers the cryptography bindings until first use."""
+        code = (
+            "import sys, camouchat_core\n"
+            "assert 'cryptography' not in sys.modules\n"
+            "assert 'KeyManager' in dir(camouchat_core)\n"
+            "camouchat_core.KeyManager\n"
+            "assert 'cryptography' in sys.modules\n"
+        )
+        env = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+        subprocess.run([sys.executable, "-c", code], check=True, env=env)
+
+    def test_dir_and_unknown_attribute(self):
+        """Test that lazy names are listed by dir() and unknown names still raise."""
+        import camouchat_core
+        import camouchat_core.Encryption
+
+        assert set(camouchat_core.__all__) <= set(dir(camouchat_core))
+        assert set(camouchat_core.Encryption.__all__) <= set(dir(camouchat_core.Encryption))
+        with pytest.raises(AttributeError):
+            camouchat_core.NotAThing  # noqa: B018
+        with pytest.raises(AttributeError):
+            camouchat_core.Encryption.NotAThing  # noqa: B018
@@ -0,0 +1,94 @@
+"""
+Unit tests for contracts package.
+"""
+
+import pytest
+
+import camouchat_core
+from camouchat_core import (
+    BulkStorageProtocol,
+    ChatProtocol,
+    MessageProtocol,
+    StorageProtocol,
+    contracts,
+)
+
+
+class _Chat:
+    name = "Alice"
+    id_serialized = "chat-1"
+    ui = None
+    timestamp = 0
+
+
+class _Message:
+    timestamp = 0
+    body = "hi"
+    msgtype = "text"
+    from_chat = _Chat()
+    ui = None
+    id_serialized = "msg-1"
+    encryption_nonce = None
+
+
+class _Storage:
+    async def init_db(self, **kwargs):
+        pass
+
+    async def create_table(self, **kwargs):
+        pass
+
+    async def start_writer(self, **kwargs):
+        pass
+
+    async def enqueue_insert(self, msgs, **kwargs):
+        pass
+
+    async def _insert_batch_internally(self, msgs, **kwargs):
+        pass
+
+    def check_message_if_exists(self, msg_id, **kwargs):
+        return False
+
+    async def check_message_if_exists_async(self, msg_id, **kwargs):
+        return False
+
+    def get_all_messages(self, **kwargs):
+        return []
+
+    async def close_db(self, **kwargs):
+        pass
+
+
+class _BulkStorage(_Storage):
+    async def check_messages_exist_async(self, msg_ids, **kwargs):
+        return set()
+
+
+def test_contracts_exported():
+    """Test that every contract in __all__ resolves from both packages."""
+    for name in contracts.__all__:
+        assert getattr(contracts, name) is getattr(camouchat_core, name)
+    assert set(contracts.__all__) <= set(dir(contracts))
+
+
+def test_runtime_checkable_contracts():
+    """Test isinstance() checks against the runtime_checkable protocols."""
+    assert isinstance(_Chat(), ChatProtocol)
+    assert isinstance(_Message(), MessageProtocol)
+    assert not isinstance(_Chat(), MessageProtocol)
+    assert not isinstance(_Message(), StorageProtocol)
+
+
+def test_bulk_storage_protocol_is_opt_in():
+    """Test that a backend without the bulk check still satisfies StorageProtocol only."""
+    assert isinstance(_Storage(), StorageProtocol)
+    assert not isinstance(_Storage(), BulkStorageProtocol)
+    assert isinstance(_BulkStorage(), StorageProtocol)
+    assert isinstance(_BulkStorage(), BulkStorageProtocol)
+
+
+def test_unknown_contract_raises():
+    """Test that unknown names still raise AttributeError."""
+    with pytest.raises(AttributeError):
+        contracts.NotAProtocol  # noqa: B018
@@ -1,8 +1,12 @@
 import json
 import logging
+import os
 import sys
+import warnings
 from unittest.mock import patch
 
+import pytest
+
 from camouchat_core import LoggerFactory
 
 
@@ -75,17 +79,188 @@ def test_logger_set_level():
 def test_logger_file_handler_setup(tmp_path):
     """Test that file handler is correctly initialized when path is provided."""
     log_file = tmp_path / "test.log"
-    LoggerFactory._root_initialized = False
-    LoggerFactory._handlers = {}
+    LoggerFactory.shutdown()
 
     log = LoggerFactory.get_logger("test_file", log_file=str(log_file), level=logging.DEBUG)
     log.info("trigger file creation")
+    # Records are written by the listener thread; shutdown drains the queue.
+    LoggerFactory.shutdown()
     assert log_file.exists()
+    assert "trigger file creation" in log_file.read_text()
 
     logger = logging.getLogger("camouchat.test_file")
     assert logger.level == logging.DEBUG
 
 
+def test_logger_routes_through_queue():
+    """Test that the root logger only holds a QueueHandler served by a listener thread."""
+    from logging.handlers import QueueHandler
+
+    LoggerFactory.shutdown()
+    LoggerFactory.get_logger("test_queue")
+
+    root = logging.getLogger("camouchat")
+    q_handler = LoggerFactory._handlers["queue"]
+    c_handler = LoggerFactory._handlers["console"]
+    assert isinstance(q_handler, QueueHandler)
+    assert q_handler in root.handlers
+    assert c_handler not in root.handlers
+    assert LoggerFactory._listener is not None
+    assert c_handler in LoggerFactory._listener.handlers
+
+    LoggerFactory.shutdown()
+    assert q_handler not in root.handlers
+    assert LoggerFactory._listener is None
+
+
+def test_logger_concurrent_first_use():
+    """Test that concurrent first calls set up the root handlers only once."""
+    from concurrent.futures import ThreadPoolExecutor
+
+    LoggerFactory.shutdown()
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(lambda i: LoggerFactory.get_logger(f"race{i}"), range(32)))
+
+    root = logging.getLogger("camouchat")
+    assert root.handlers.count(LoggerFactory._handlers["queue"]) == 1
+    assert len([h for h in root.handlers if isinstance(h, logging.handlers.QueueHandler)]) == 1
+    LoggerFactory.shutdown()
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="os.fork is not available")
+def test_logger_records_survive_fork(tmp_path):
+    """Test that a forked child's records reach the log file even when it exits via os._exit."""
+    log_file = tmp_path / "fork.log"
+    LoggerFactory.shutdown()
+    log = LoggerFactory.get_logger("test_fork", log_file=str(log_file))
+    log.info("before fork")
+
+    # Python 3.12+ warns (it cannot raise) when forking with other threads alive.
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always", DeprecationWarning)
+        pid = os.fork()
+    if pid == 0:
+        try:
+            log.info("from child")
+        finally:
+            os._exit(0)
+
+    _, status = os.waitpid(pid, 0)
+    assert os.waitstatus_to_exitcode(status) == 0
+    assert not [w for w in caught if issubclass(w.category, DeprecationWarning)]
+    log.info("from parent")
+    assert LoggerFactory._listener is not None
+    assert LoggerFactory._listener._thread is not None
+    LoggerFactory.shutdown()
+
+    text = log_file.read_text()
+    assert text.count("before fork") == 1
+    assert "from child" in text
+    assert "from parent" in text
+
+
+def test_logger_module_hooks_use_current_factory():
+    """Test that the fork and exit hooks act on the current LoggerFactory."""
+    from camouchat_core.logger import (
+        _after_fork_in_child,
+        _after_fork_in_parent,
+        _before_fork,
+        _shutdown_at_exit,
+    )
+
+    LoggerFactory.shutdown()
+    _before_fork()
+    _after_fork_in_child()
+    assert LoggerFactory._handlers == {}
+    assert LoggerFactory._listener is None
+
+    LoggerFactory.get_logger("test_hooks")
+    listener = LoggerFactory._listener
+    for _ in range(2):
+        _before_fork()
+        assert listener._thread is None
+        _after_fork_in_parent()
+        assert LoggerFactory._listener_paused
+        assert not LoggerFactory._init_lock.locked()
+
+    LoggerFactory.get_logger("test_hooks").info("resumes listener")
+    assert LoggerFactory._listener is listener
+    assert listener._thread is not None
+    assert not LoggerFactory._listener_paused
+
+    LoggerFactory.get_logger("test_hooks")
+    _shutdown_at_exit()
+    assert not LoggerFactory._root_initialized
+    assert LoggerFactory._listener is None
+
+
+def test_logger_shutdown_drains_paused_listener(tmp_path):
+    """Test that shutdown writes records queued while the listener was paused for a fork."""
+    from camouchat_core.logger import _after_fork_in_parent, _before_fork
+
+    log_file = tmp_path / "paused.log"
+    LoggerFactory.shutdown()
+    log = LoggerFactory.get_logger("test_paused", log_file=str(log_file))
+    _before_fork()
+    _after_fork_in_parent()
+
+    # Put on the queue directly, as a record racing the fork would be, without resuming.
+    record = log.logger.makeRecord(
+        log.logger.name, logging.INFO, __file__, 0, "queued while paused", (), None, extra=log.extra
+    )
+    LoggerFactory._listener.queue.put_nowait(record)
+    LoggerFactory.shutdown()
+
+    assert not LoggerFactory._listener_paused
+    assert "queued while paused" in log_file.read_text()
+
+
+@pytest.mark.skipif(not os.path.isdir("/proc/self/task"), reason="needs /proc thread listing")
+def test_logger_fork_waits_for_listener_os_thread(monkeypatch):
+    """Test that the before-fork hook returns only once the listener's OS thread is gone."""
+    import camouchat_core.logger
+    from camouchat_core.logger import _after_fork_in_parent, _before_fork
+
+    monkeypatch.setattr(camouchat_core.logger, "_WAIT_FOR_OS_THREAD_EXIT", True)
+    LoggerFactory.shutdown()
+    LoggerFactory.get_logger("test_os_thread")
+    _before_fork()
+    try:
+        assert camouchat_core.logger._os_thread_count() == 1
+    finally:
+        _after_fork_in_parent()
+    LoggerFactory.shutdown()
+
+
+def test_logger_wait_for_os_thread_exit_polls(monkeypatch):
+    """Test that the OS thread wait polls until the count drops below the starting count."""
+    import camouchat_core.logger
+
+    counts = iter([2, 2, 1])
+    monkeypatch.setattr(camouchat_core.logger, "_os_thread_count", lambda: next(counts))
+    camouchat_core.logger._wait_for_os_thread_exit(2)
+    assert next(counts, None) is None
+
+
+def test_logger_file_handler_is_delayed(tmp_path, monkeypatch):
+    """Test that the fallback rotating handler does not open the log file until first emit."""
+    from logging.handlers import RotatingFileHandler
+
+    import camouchat_core.logger
+
+    monkeypatch.setattr(camouchat_core.logger, "ConcurrentRotatingFileHandler", RotatingFileHandler)
+    log_file = tmp_path / "delayed.log"
+    LoggerFactory.shutdown()
+
+    log = LoggerFactory.get_logger("test_delay", log_file=str(log_file))
+    assert LoggerFactory._handlers["file"].stream is None
+    assert not log_file.exists()
+
+    log.info("first record")
+    LoggerFactory.shutdown()
+    assert "first record" in log_file.read_text()
+
+
 def test_logger_adapter_process():
     """Test CamouAdapter.process correctly merges extra kwargs."""
     from camouchat_core.logger import CamouAdapter